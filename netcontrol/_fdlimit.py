@@ -0,0 +1,36 @@
+"""
+Socket budget helper for the NetControl scanners.
+
+fd_limited() sizes a scanner's in-flight connect count to what the OS
+will actually allow: the RLIMIT_NOFILE soft limit on Linux/macOS, and
+select()'s 512-socket ceiling on Windows for selector-based scans.
+"""
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+# CPython's select() on Windows is built with FD_SETSIZE 512; leave a
+# little headroom for the sockets that aren't part of the scan
+WIN_SELECT_MAX = 500
+
+def fd_limited(concurrency, uses_select=False):
+    # Every in-flight connect holds a socket; raise the soft fd limit as far
+    # as allowed and keep ~64 spare for stdio, the CSV and the event loop.
+    if resource is None:
+        # Windows: no rlimit, but if the sockets go through select() (which
+        # is what selectors uses there) it refuses more than 512 per call
+        return max(1, min(concurrency, WIN_SELECT_MAX)) if uses_select else concurrency
+    soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+    wanted = concurrency + 64
+    if soft != resource.RLIM_INFINITY and soft < wanted:
+        target = wanted if hard == resource.RLIM_INFINITY else min(wanted, hard)
+        try:
+            resource.setrlimit(resource.RLIMIT_NOFILE, (target, hard))
+            soft = target
+        except (ValueError, OSError):
+            pass
+    if soft == resource.RLIM_INFINITY:
+        return concurrency
+    return max(1, min(concurrency, soft - 64))
@@ -0,0 +1,29 @@
+"""
+Shared target resolution for the NetControl tools.
+
+Lookups are memoised per process, so a target that shows up in several
+scans or intervals only costs one DNS round-trip. CIDR blocks are
+expanded with integer arithmetic rather than ipaddress objects.
+"""
+
+import functools
+import ipaddress
+import socket
+import struct
+
+_pack_ipv4 = struct.Struct("!I").pack
+
+@functools.lru_cache(maxsize=8192)
+def resolve(host):
+    return socket.gethostbyname(host)
+
+def expand_network(cidr):
+    net = ipaddress.ip_network(cidr, strict=False)
+    if net.version != 4:
+        return [str(ip) for ip in net.hosts()]
+    base = int(net.network_address)
+    count = net.num_addresses
+    # Same as hosts(): skip network/broadcast except on /31 and /32
+    first, last = (0, count) if count <= 2 else (1, count - 1)
+    ntoa = socket.inet_ntoa
+    return [ntoa(_pack_ipv4(n)) for n in range(base + first, base + last)]
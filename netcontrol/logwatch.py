@@ -113,8 +113,7 @@ def save_table_to_csv(rows):
         with open(filename, "w", newline="") as f:
             writer = csv.writer(f)
             writer.writerow(["Time", "Matched Line"])
-            for row in rows:
-                writer.writerow(row)
+            writer.writerows(rows)
         console.print(f"[bold green][+] Saved current view to:[/] {filename}")
     except Exception as e:
         console.print(f"[bold red][-] Failed to save CSV: {e}")
@@ -211,7 +210,7 @@ def scan_file(file_path, keywords, ips, regex, csv_out):
     except Exception as e:
         print(Fore.RED + f"[-] Error reading file: {e}")
 
-def main():
+def main(argv=None):
     parser = argparse.ArgumentParser(description="LogWatch - Firewall & IDS Log Analyzer")
     parser.add_argument("-f", "--file", help="Log file path", required=True)
     parser.add_argument("--filter", help="Comma-separated keywords")
@@ -221,7 +220,7 @@ def main():
     parser.add_argument("--output", help="Output CSV file (optional)")
     parser.add_argument("--tui", help="Display output in a terminal UI (requires rich)", action="store_true")
 
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
     if not os.path.isfile(args.file):
         print(Fore.RED + f"[-] File not found: {args.file}")
         return
@@ -2,9 +2,9 @@
 """
 Ping Sweep Script (Cross-Platform)
 
-Performs a multithreaded ping sweep over a given subnet.
+Performs a concurrent ping sweep over a given subnet.
 Features:
-- Threading for speed
+- ICMP echo over a single shared socket, with a threaded `ping` fallback
 - Hostname resolution
 - Color-coded terminal output
 - CSV output with headers
@@ -18,30 +18,58 @@ USAGE EXAMPLE:
 Arguments:
     subnet         The subnet to scan (CIDR notation)
     -o, --output   Output CSV file name (optional)
-    -t, --threads  Number of concurrent threads (optional, default=100)
+    -t, --threads  Number of concurrent probes (optional, default=100)
 
 Dependencies:
     pip install colorama tqdm
 
+ICMP sockets need either unprivileged ping sockets (Linux
+net.ipv4.ping_group_range, macOS) or root/Administrator for raw
+sockets; otherwise the sweep falls back to the system `ping` command.
+
 Tested on Ubuntu, Windows, and macOS.
 """
 
-import ipaddress
 import subprocess
 import socket
 import argparse
 import csv
+import ipaddress
+import itertools
 import logging
 import os
 import platform
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import re
+import select
+import struct
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from tqdm import tqdm
-from colorama import Fore, init
+from colorama import Fore, Style, init
 from datetime import datetime
+from _resolve import expand_network
 
 # Init colorama
 init(autoreset=True)
 
+# Live results go through tqdm.write so they don't tear the progress bar
+GREEN, RESET = Fore.GREEN, Style.RESET_ALL
+
+# Matches "time=0.42 ms" (Linux/macOS) and "time<1ms" / "time=3ms" (Windows)
+_TIME_RE = re.compile(rb"time([=<])\s*([\d.]+)\s*ms", re.IGNORECASE)
+
+def parse_latency(output):
+    m = _TIME_RE.search(output)
+    if not m:
+        return "Unknown"
+    # Keep Windows' "<1" as-is rather than overstating it as 1 ms
+    value = m.group(2).decode()
+    return "<" + value if m.group(1) == b"<" else value
+
+def format_latency(latency):
+    # Only numeric readings ("0.42", "<1") get a unit
+    return latency if latency == "Unknown" else f"{latency} ms"
+
 # -------------------------------
 # Function: Setup logging
 # -------------------------------
@@ -51,10 +79,129 @@ def setup_logger():
         filename=log_filename,
         level=logging.INFO,
         format='[%(asctime)s] %(levelname)s: %(message)s',
-        datefmt='%Y-%m-%d %H:%M:%S'
+        datefmt='%Y-%m-%d %H:%M:%S',
+        force=True
     )
     return log_filename
 
+# -------------------------------
+# Function: Reverse-resolve a live host
+# -------------------------------
+def resolve_hostname(ip):
+    try:
+        return socket.gethostbyaddr(str(ip))[0]
+    except (socket.herror, socket.gaierror):
+        return "Unknown"
+
+# -------------------------------
+# Function: ICMP echo packets
+# -------------------------------
+ICMP_ECHO_REQUEST = 8
+ICMP_ECHO_REPLY = 0
+ICMP_PAYLOAD = b"netcontrol-sweep"
+
+def icmp_checksum(data):
+    if len(data) % 2:
+        data += b"\x00"
+    total = sum(struct.unpack(f"!{len(data) // 2}H", data))
+    total = (total >> 16) + (total & 0xFFFF)
+    total += total >> 16
+    return ~total & 0xFFFF
+
+def build_echo(ident, seq):
+    header = struct.pack("!BBHHH", ICMP_ECHO_REQUEST, 0, 0, ident, seq)
+    checksum = icmp_checksum(header + ICMP_PAYLOAD)
+    return struct.pack("!BBHHH", ICMP_ECHO_REQUEST, 0, checksum, ident, seq) + ICMP_PAYLOAD
+
+def open_icmp_socket():
+    # Unprivileged ping socket first; the kernel owns the echo identifier
+    # there. Raw sockets need root/Administrator and see all ICMP traffic.
+    try:
+        return socket.socket(socket.AF_INET, socket.SOCK_DGRAM, socket.IPPROTO_ICMP), False
+    except OSError:
+        return socket.socket(socket.AF_INET, socket.SOCK_RAW, socket.IPPROTO_ICMP), True
+
+# -------------------------------
+# Function: ICMP sweep over one socket
+# -------------------------------
+def icmp_sweep(hosts, window, timeout=1.0):
+    """
+    Ping every host through one ICMP socket. Up to `window` echoes are in
+    flight at once, each tagged with its own sequence number so replies can
+    be matched back to the host that was probed.
+    """
+    sock, raw = open_icmp_socket()
+    ident = os.getpid() & 0xFFFF
+    window = max(1, min(window, 0xFFFF))
+    todo = iter(enumerate(hosts))
+    pending = {}  # seq -> (ip, sent_at), oldest first
+    replies = []
+
+    with sock, tqdm(total=len(hosts), desc="Scanning", ncols=80) as pbar:
+        try:
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 1 << 20)
+        except OSError:
+            pass
+
+        while True:
+            while len(pending) < window:
+                item = next(todo, None)
+                if item is None:
+                    break
+                index, ip = item
+                seq = index & 0xFFFF
+                pending[seq] = (ip, time.perf_counter())
+                try:
+                    sock.sendto(build_echo(ident, seq), (ip, 0))
+                except OSError:
+                    del pending[seq]
+                    pbar.update(1)
+
+            if not pending:
+                break
+
+            # Sleep until a reply arrives or the oldest probe times out
+            oldest = next(iter(pending.values()))[1]
+            wait = max(0.0, oldest + timeout - time.perf_counter())
+            readable, _, _ = select.select([sock], [], [], wait)
+
+            while readable:
+                try:
+                    data, addr = sock.recvfrom(1024)
+                except OSError:
+                    break
+                received = time.perf_counter()
+                # Raw sockets (and macOS ping sockets) include the IPv4 header
+                if data and data[0] >> 4 == 4:
+                    data = data[(data[0] & 0x0F) * 4:]
+                if len(data) >= 8:
+                    icmp_type, _, _, reply_ident, seq = struct.unpack("!BBHHH", data[:8])
+                    entry = pending.get(seq)
+                    if (icmp_type == ICMP_ECHO_REPLY and entry and entry[0] == addr[0]
+                            and (not raw or reply_ident == ident)):
+                        del pending[seq]
+                        replies.append((entry[0], round((received - entry[1]) * 1000, 2)))
+                        pbar.update(1)
+                readable, _, _ = select.select([sock], [], [], 0)
+
+            now = time.perf_counter()
+            for seq, (ip, sent_at) in list(pending.items()):
+                if now - sent_at < timeout:
+                    break
+                del pending[seq]
+                pbar.update(1)
+
+    # Reverse DNS is blocking, so resolve once probing is done rather than
+    # skewing the RTTs of probes still in flight.
+    with ThreadPoolExecutor(max_workers=min(32, len(replies) or 1)) as executor:
+        hostnames = list(executor.map(resolve_hostname, (ip for ip, _ in replies)))
+
+    live_hosts = []
+    for (ip, latency), hostname in zip(replies, hostnames):
+        tqdm.write(f"{GREEN}[+] {ip} is up ({hostname}) - {format_latency(latency)}{RESET}")
+        live_hosts.append((ip, hostname, latency))
+    return live_hosts
+
 # -------------------------------
 # Function: Ping a single IP address (cross-platform)
 # -------------------------------
@@ -66,32 +213,51 @@ def ping_host(ip):
         cmd = ["ping", "-c", "1", "-W", "1", str(ip)]
 
     try:
-        result = subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        result = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL)
         if result.returncode == 0:
-            try:
-                hostname = socket.gethostbyaddr(str(ip))[0]
-            except socket.herror:
-                hostname = "Unknown"
-            return f"{ip},{hostname}"
+            latency = parse_latency(result.stdout)
+            return str(ip), resolve_hostname(ip), latency
     except Exception:
         pass
     return None
 
+# -------------------------------
+# Function: Threaded sweep using the system `ping` command
+# -------------------------------
+def subprocess_sweep(hosts, threads):
+    live_hosts = []
+    remaining = iter(hosts)
+    # Sliding window: keep ~2x workers queued instead of a Future per host
+    window = threads * 2
+    with ThreadPoolExecutor(max_workers=threads) as executor, \
+            tqdm(total=len(hosts), desc="Scanning", ncols=80) as bar:
+        pending = {executor.submit(ping_host, ip) for ip in itertools.islice(remaining, window)}
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                result = future.result()
+                if result:
+                    ip, hostname, latency = result
+                    tqdm.write(f"{GREEN}[+] {ip} is up ({hostname}) - {format_latency(latency)}{RESET}")
+                    live_hosts.append(result)
+            bar.update(len(done))
+            pending.update(executor.submit(ping_host, ip) for ip in itertools.islice(remaining, len(done)))
+    return live_hosts
+
 # -------------------------------
 # Main Execution Logic
 # -------------------------------
-def main():
+def main(argv=None):
     parser = argparse.ArgumentParser(description="Ping Sweep Tool (Cross-Platform)")
     parser.add_argument("subnet", help="Target subnet (e.g., 192.168.1.0/24)")
     parser.add_argument("-o", "--output", help="Output CSV file (e.g., live_hosts.csv)", default=None)
-    parser.add_argument("-t", "--threads", help="Number of threads (default: 100)", type=int, default=100)
+    parser.add_argument("-t", "--threads", help="Concurrent probes (default: 100)", type=int, default=100)
 
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
     log_file = setup_logger()
 
     try:
-        ip_net = ipaddress.ip_network(args.subnet, strict=False)
-        all_hosts = list(ip_net.hosts())
+        all_hosts = expand_network(args.subnet)
     except ValueError as e:
         print(f"{Fore.RED}[-] Invalid subnet: {e}")
         logging.error(f"Invalid subnet: {e}")
@@ -100,25 +266,25 @@ def main():
     print(f"{Fore.CYAN}[+] Starting ping sweep on subnet {args.subnet} with {args.threads} threads...\n")
     logging.info(f"Started scan on {args.subnet} with {args.threads} threads.")
 
-    live_hosts = []
-
-    with ThreadPoolExecutor(max_workers=args.threads) as executor:
-        futures = {executor.submit(ping_host, ip): ip for ip in all_hosts}
-        for future in tqdm(as_completed(futures), total=len(futures), desc="Scanning", ncols=80):
-            result = future.result()
-            if result:
-                ip, hostname = result.split(",")
-                print(Fore.GREEN + f"[+] {ip} is up ({hostname})")
-                live_hosts.append((ip, hostname))
+    # The shared ICMP socket is IPv4-only; system ping handles IPv6 subnets
+    if ipaddress.ip_network(args.subnet, strict=False).version != 4:
+        logging.info("IPv6 subnet, sweeping with system ping.")
+        live_hosts = subprocess_sweep(all_hosts, args.threads)
+    else:
+        try:
+            live_hosts = icmp_sweep(all_hosts, args.threads)
+        except OSError as e:
+            print(f"{Fore.YELLOW}[!] ICMP sockets unavailable ({e}), falling back to system ping.")
+            logging.warning(f"ICMP sockets unavailable, falling back to system ping: {e}")
+            live_hosts = subprocess_sweep(all_hosts, args.threads)
 
     if args.output:
         try:
             output_path = os.path.abspath(args.output)
             with open(output_path, "w", newline="") as f:
                 writer = csv.writer(f)
-                writer.writerow(["IP", "Hostname"])
-                for ip, hostname in live_hosts:
-                    writer.writerow([ip, hostname])
+                writer.writerow(["IP", "Hostname", "Latency (ms)"])
+                writer.writerows(live_hosts)
             print(f"\n{Fore.YELLOW}[+] Results saved to: {output_path}")
             logging.info(f"Results saved to: {output_path}")
         except Exception as e:
@@ -7,46 +7,139 @@ Scans ports for given IPs and outputs open/closed results in a CSV file.
 Usage Examples:
     portscan -f targets.txt -o results.csv -t 100 --fast
     portscan -f targets.txt -o results.csv -p 22,80,443 --timeout 3
+    sudo portscan -f targets.txt -o results.csv --fast --syn   # requires scapy
 """
 
 import argparse
+import asyncio
 import socket
 import csv
-import concurrent.futures
 import ipaddress
+import mmap
 import string
+import struct
+from functools import lru_cache
 from tqdm import tqdm
 from socket import getservbyport
 import subprocess
 import os
+from _fdlimit import fd_limited
+from _resolve import resolve
+
+TOP_PORTS = tuple(sorted({
+    21, 22, 23, 25, 53, 80, 110, 111, 135, 139, 143, 443, 445, 993, 995,
+    1723, 3306, 3389, 5900, 8080, 8443
+} | set(range(1, 1025))))
+
+# SO_LINGER {on, 0s}: close() sends RST instead of FIN, so finished probes
+# never sit in TIME_WAIT holding an ephemeral port.
+LINGER_RST = struct.pack("ii", 1, 0)
+
+# Services that greet first, speak HTTP, or will never answer a plain-text probe.
+BANNER_FIRST = {21, 22, 25, 110, 143, 3306}
+HTTP_LIKE = {80, 8000, 8080}
+SKIP_BANNER = {443, 445, 3389, 993, 995, 8443}
+
+# Byte table mapping anything outside string.printable to "?".
+_BANNER_TABLE = bytes(b if chr(b) in string.printable else ord("?") for b in range(256))
 
 def clean_banner(text):
-    return ''.join(c if c in string.printable else '?' for c in text).strip()
+    # Encoding replaces every non-ASCII char with "?", the table handles
+    # ASCII control bytes; both passes run in C.
+    return text.encode("ascii", "replace").translate(_BANNER_TABLE).decode("ascii").strip()
 
-def scan_port(ip, port, timeout):
+async def scan_port(ip, port, timeout, keep_errors=True):
     try:
-        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
-            sock.settimeout(timeout)
-            result = sock.connect_ex((ip, port))
-            if result == 0:
-                try:
-                    sock.sendall(b"\r\n")
-                    banner = sock.recv(1024).decode(errors="ignore")
-                    banner = clean_banner(banner)
-                except:
-                    banner = "-"
-                return (ip, port, "open", get_service_name(port), banner)
-            else:
-                return (ip, port, "closed", get_service_name(port), "-")
-    except:
-        return None  # skip error ports completely
+        reader, writer = await asyncio.wait_for(asyncio.open_connection(ip, port), timeout)
+    except (ConnectionRefusedError, asyncio.TimeoutError):
+        return (ip, port, "closed", get_service_name(port), "-")
+    except OSError:
+        # Unreachable host/network etc.: closed, unless --clean drops error ports
+        return (ip, port, "closed", get_service_name(port), "-") if keep_errors else None
 
-def get_service_name(port):
     try:
-        return getservbyport(port)
-    except:
+        sock = writer.get_extra_info("socket")
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_LINGER, LINGER_RST)
+        if hasattr(socket, "TCP_QUICKACK"):
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_QUICKACK, 1)
+        banner = await grab_banner(reader, writer, ip, port)
+    except (OSError, asyncio.TimeoutError):
+        banner = "-"
+    finally:
+        writer.close()
+    return (ip, port, "open", get_service_name(port), banner)
+
+async def grab_banner(reader, writer, ip, port):
+    if port in SKIP_BANNER:
         return "-"
+    if port in HTTP_LIKE:
+        writer.write(f"HEAD / HTTP/1.1\r\nHost: {ip}\r\n\r\n".encode())
+        await writer.drain()
+    elif port not in BANNER_FIRST:
+        writer.write(b"\r\n")
+        await writer.drain()
+    banner = await asyncio.wait_for(reader.read(1024), 0.5)
+    return clean_banner(banner.decode(errors="ignore"))
 
+async def scan_all(targets, ports, timeout, concurrency, keep_errors):
+    # A fixed pool of workers pulls from one shared task stream, so at most
+    # `concurrency` connects are in flight and no per-port task is queued.
+    tasks = ((ip, port) for ip in targets for port in ports)
+    total = len(targets) * len(ports)
+    results = []
+
+    with tqdm(total=total, desc="Scanning") as pbar:
+        async def worker():
+            for ip, port in tasks:
+                res = await scan_port(ip, port, timeout, keep_errors)
+                if res:
+                    results.append(res)
+                pbar.update(1)
+
+        await asyncio.gather(*(worker() for _ in range(min(concurrency, total))))
+    return results
+
+def syn_scan(targets, ports, timeout):
+    # Half-open scan: send SYN, read SYN+ACK/RST, never complete the
+    # handshake (the kernel answers the SYN+ACK with RST for us).
+    try:
+        from scapy.all import IP, TCP, sr
+    except ImportError:
+        print("[-] --syn requires scapy (pip install scapy).")
+        return None
+
+    results = []
+    for ip in tqdm(targets, desc="SYN scanning"):
+        try:
+            answered, unanswered = sr(IP(dst=ip) / TCP(dport=list(ports), flags="S"), timeout=timeout, verbose=0)
+        except OSError as e:
+            print(f"[-] SYN scan needs raw socket access (run as root): {e}")
+            return None
+        for sent, received in answered:
+            port = sent[TCP].dport
+            tcp = received.getlayer(TCP)
+            if tcp is not None and int(tcp.flags) & 0x12 == 0x12:
+                results.append((ip, port, "open", get_service_name(port), "-"))
+            else:
+                results.append((ip, port, "closed", get_service_name(port), "-"))
+        for sent in unanswered:
+            port = sent[TCP].dport
+            results.append((ip, port, "closed", get_service_name(port), "-"))
+    return results
+
+SERVICE_MAP = {}
+
+def load_service_map(ports):
+    for port in ports:
+        try:
+            SERVICE_MAP[port] = getservbyport(port, "tcp")
+        except OSError:
+            pass
+
+def get_service_name(port):
+    return SERVICE_MAP.get(port, "-")
+
+@lru_cache(maxsize=64)
 def parse_ports(ports_str):
     ports = set()
     for part in ports_str.split(","):
@@ -55,22 +148,26 @@ def parse_ports(ports_str):
             ports.update(range(start, end + 1))
         else:
             ports.add(int(part))
-    return sorted(ports)
+    return tuple(sorted(ports))
 
 def load_targets(file):
-    with open(file, "r") as f:
-        return [line.strip() for line in f if line.strip()]
+    # Slurp the file through mmap and split/strip as bytes, so expanded
+    # subnet lists don't go line-by-line through the text layer.
+    with open(file, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return []
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            lines = mm[:].splitlines()
+    return [line.decode() for line in map(bytes.strip, lines) if line and not line.startswith(b"#")]
 
 def write_csv(results, output_file):
     try:
         with open(output_file, "w", newline="", encoding="utf-8-sig") as f:
             writer = csv.writer(f, quoting=csv.QUOTE_ALL, escapechar="\\")
             writer.writerow(["IP", "Port", "Status", "Service", "Banner"])
-            for row in results:
-                if row:  # Skip None values from errors
-                    row = list(row)
-                    row[4] = clean_banner(str(row[4]))
-                    writer.writerow(row)
+            # Skip None values from errors
+            cleaned = [(*row[:4], clean_banner(str(row[4]))) for row in results if row]
+            writer.writerows(cleaned)
         print(f"[+] Results saved to: {output_file}")
 
         # Try to open with LibreOffice Calc
@@ -111,52 +208,53 @@ def validate_ip(ip):
     except ValueError:
         return False
 
-def main():
+def main(argv=None):
     parser = argparse.ArgumentParser(description="Custom Port Scanner")
     parser.add_argument("-f", "--file", required=True, help="Input file with IPs")
     parser.add_argument("-o", "--output", required=True, help="CSV output file")
-    parser.add_argument("-t", "--threads", type=int, default=100, help="Number of threads")
+    parser.add_argument("-t", "--threads", type=int, default=100, help="Concurrency factor (x20 in-flight connects)")
     parser.add_argument("-p", "--ports", help="Ports to scan (e.g., 80,443 or 1-1000)")
     parser.add_argument("--fast", action="store_true", help="Scan top 1000 ports")
     parser.add_argument("--timeout", type=float, default=1, help="Socket timeout")
     parser.add_argument("--clean", action="store_true", help="Remove error ports from CSV")
-    args = parser.parse_args()
-
-    top_ports = [
-        21, 22, 23, 25, 53, 80, 110, 111, 135, 139, 143, 443, 445, 993, 995,
-        1723, 3306, 3389, 5900, 8080, 8443
-    ] + list(range(1, 1025))
+    parser.add_argument("--syn", action="store_true", help="Half-open SYN scan via scapy (root, no banners)")
+    args = parser.parse_args(argv)
 
     if args.fast:
-        ports = sorted(set(top_ports))
+        ports = TOP_PORTS
     elif args.ports:
         ports = parse_ports(args.ports)
     else:
         ports = choose_ports()
         if ports == "fast":
-            ports = sorted(set(top_ports))
+            ports = TOP_PORTS
+
+    load_service_map(ports)
 
     targets = load_targets(args.file)
-    valid_targets = [ip for ip in targets if validate_ip(ip)]
+    valid_targets = []
+    for target in targets:
+        if validate_ip(target):
+            valid_targets.append(target)
+            continue
+        try:
+            valid_targets.append(resolve(target))
+        except (OSError, UnicodeError):  # gaierror, or an IDNA-invalid name
+            print(f"[-] Skipping unresolvable target: {target}")
 
     if not valid_targets:
         print("[-] No valid IP addresses found.")
         return
 
-    total_tasks = len(valid_targets) * len(ports)
     print(f"[+] Scanning {len(valid_targets)} targets on {len(ports)} ports each.")
 
-    results = []
-    with concurrent.futures.ThreadPoolExecutor(max_workers=args.threads) as executor:
-        futures = []
-        for ip in valid_targets:
-            for port in ports:
-                futures.append(executor.submit(scan_port, ip, port, args.timeout))
-
-        for result in tqdm(concurrent.futures.as_completed(futures), total=total_tasks, desc="Scanning"):
-            res = result.result()
-            if res or not args.clean:
-                results.append(res)
+    if args.syn:
+        results = syn_scan(valid_targets, ports, args.timeout)
+        if results is None:
+            return
+    else:
+        concurrency = fd_limited(args.threads * 20)
+        results = asyncio.run(scan_all(valid_targets, ports, args.timeout, concurrency, not args.clean))
 
     write_csv(results, args.output)
     print("[+] Scan complete.")
@@ -8,22 +8,25 @@ Detects:
 - Closed ports (were open, now closed)
 
 Features:
-- Threaded scanning
+- Single-threaded non-blocking scanning (selectors)
 - Full port or custom port range
-- Auto-creates baseline JSON if missing
+- Auto-creates baseline JSON if missing (one small file per target)
 - Optional CSV/JSON diff log output
 - Works on Windows, Linux, macOS
 
 USAGE EXAMPLES:
     portwatch 192.168.1.1 -p 1-1000
-    portwatch 192.168.1.1 -p 22,80 -b my_baseline.json -o port_diff.csv --save-new
+    portwatch 192.168.1.1 -p 22,80 -b my_baselines -o port_diff.csv --save-new
 
 Arguments:
     target              Target IP or hostname
     -p, --ports         Ports or ranges (e.g. 22,80,1000-1100)
-    -b, --baseline      Baseline JSON file (default: portwatch_baseline.json)
+    -b, --baseline      Baseline directory (default: portwatch_baseline)
+                        An old single-file <name>.json baseline is split
+                        into <name>/ automatically on first run
     -o, --output        Output CSV file (optional)
-    -t, --threads       Thread count (default: 100)
+    -t, --threads       Max connects in flight (default: 1024, capped at 500
+                        on Windows where select() tops out at 512 sockets)
     --save-new          Overwrite baseline with current state after scan
 
 Dependencies:
@@ -42,9 +45,15 @@ import argparse
 import json
 import os
 import csv
+import errno
+import selectors
+import struct
+import time
+from urllib.parse import quote
 from tqdm import tqdm
 from colorama import Fore, init
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from _fdlimit import fd_limited
+from _resolve import resolve
 
 init(autoreset=True)
 
@@ -52,76 +61,183 @@ init(autoreset=True)
 # Parse ports
 # -------------------------------
 def parse_ports(port_str):
-    ports = set()
+    # Keep ranges as (start, end) pairs and merge overlaps, instead of
+    # expanding "1-65535" into a set of 65k ints just to sort it again
+    intervals = []
     for part in port_str.split(","):
         if "-" in part:
             start, end = map(int, part.split("-"))
-            ports.update(range(start, end + 1))
         else:
-            ports.add(int(part.strip()))
-    return sorted(ports)
+            start = end = int(part.strip())
+        if start > end:
+            raise ValueError(f"reversed range {part.strip()}")
+        # connect_ex() raises OverflowError past 65535, so check up front
+        if not 1 <= start <= end <= 65535:
+            raise ValueError(f"{part.strip()} is outside 1-65535")
+        intervals.append((start, end))
+    intervals.sort()
+
+    merged = []
+    for start, end in intervals:
+        if merged and start <= merged[-1][1] + 1:
+            if end > merged[-1][1]:
+                merged[-1] = (merged[-1][0], end)
+        else:
+            merged.append((start, end))
+    return merged
+
+def iter_ports(port_ranges):
+    for start, end in port_ranges:
+        yield from range(start, end + 1)
 
 # -------------------------------
-# Scan single port
+# Scan ports (non-blocking connects)
 # -------------------------------
-def scan_port(ip, port):
+# connect_ex() on a non-blocking socket reports "in progress" with these
+IN_PROGRESS = {0, errno.EINPROGRESS, errno.EWOULDBLOCK, getattr(errno, "WSAEWOULDBLOCK", 10035)}
+LINGER_RST = struct.pack("ii", 1, 0)
+PROGRESS_STEP = 256  # Ports per progress bar update
+
+def scan_ports(ip, ports, timeout=1.0, max_inflight=1024):
+    """Yield (port, is_open) for every port, keeping up to max_inflight connects open at once."""
+    sel = selectors.DefaultSelector()
+    pending = iter(ports)
+    inflight = {}  # sock -> deadline; all share one timeout, so oldest first
     try:
-        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-        sock.settimeout(1)
-        result = sock.connect_ex((ip, port))
-        sock.close()
-        if result == 0:
-            return port
-    except:
-        pass
-    return None
+        while True:
+            while len(inflight) < max_inflight:
+                port = next(pending, None)
+                if port is None:
+                    break
+                sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+                # Reset on close so open ports don't leave TIME_WAIT sockets behind
+                sock.setsockopt(socket.SOL_SOCKET, socket.SO_LINGER, LINGER_RST)
+                sock.setblocking(False)
+                err = sock.connect_ex((ip, port))
+                if err in IN_PROGRESS:
+                    sel.register(sock, selectors.EVENT_WRITE, port)
+                    inflight[sock] = time.monotonic() + timeout
+                else:
+                    sock.close()
+                    yield port, False
+
+            if not inflight:
+                break
+
+            wait = max(0.0, next(iter(inflight.values())) - time.monotonic())
+            for key, _ in sel.select(wait):
+                sock = key.fileobj
+                is_open = sock.getsockopt(socket.SOL_SOCKET, socket.SO_ERROR) == 0
+                sel.unregister(sock)
+                del inflight[sock]
+                sock.close()
+                yield key.data, is_open
+
+            # Anything still unanswered past its deadline counts as closed
+            now = time.monotonic()
+            while inflight:
+                sock, deadline = next(iter(inflight.items()))
+                if deadline > now:
+                    break
+                port = sel.get_key(sock).data
+                sel.unregister(sock)
+                del inflight[sock]
+                sock.close()
+                yield port, False
+    finally:
+        for sock in inflight:
+            sock.close()
+        sel.close()
+
+# -------------------------------
+# Save baseline (compact, atomic)
+# -------------------------------
+def save_baseline(path, ports):
+    # Write next to the target and swap it in, so an interrupted save
+    # never leaves a half-written baseline behind
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w") as f:
+        json.dump(ports, f, separators=(",", ":"))
+    os.replace(tmp_path, path)
+
+# -------------------------------
+# Baseline directory (one file per target)
+# -------------------------------
+def baseline_path(directory, target):
+    # Percent-encode so IPv6 colons etc. are safe in a filename on any OS
+    return os.path.join(directory, quote(target, safe="") + ".json")
+
+def open_baseline_dir(path):
+    directory = path[:-5] if path.endswith(".json") else path
+    legacy = directory + ".json"
+    os.makedirs(directory, exist_ok=True)
+
+    # Older versions kept every target in one JSON map; split it once
+    if os.path.isfile(legacy):
+        with open(legacy, "r") as f:
+            legacy_data = json.load(f)
+        for target, ports in legacy_data.items():
+            target_path = baseline_path(directory, target)
+            if not os.path.exists(target_path):
+                save_baseline(target_path, ports)
+        os.replace(legacy, legacy + ".migrated")
+        print(Fore.CYAN + f"[+] Split {legacy} into per-target baselines under {directory}/")
+    return directory
 
 # -------------------------------
 # Main logic
 # -------------------------------
-def main():
+def main(argv=None):
     parser = argparse.ArgumentParser(description="Live Port Change Watcher")
     parser.add_argument("target", help="Target IP or hostname")
     parser.add_argument("-p", "--ports", help="Ports or ranges (e.g. 22,80,1000-2000)", required=True)
-    parser.add_argument("-b", "--baseline", help="Baseline file (default: portwatch_baseline.json)", default="portwatch_baseline.json")
+    parser.add_argument("-b", "--baseline", help="Baseline directory (default: portwatch_baseline)", default="portwatch_baseline")
     parser.add_argument("-o", "--output", help="CSV diff output file (optional)")
-    parser.add_argument("-t", "--threads", type=int, default=100, help="Thread count")
+    parser.add_argument("-t", "--threads", type=int, default=1024, help="Max connects in flight")
     parser.add_argument("--save-new", action="store_true", help="Overwrite baseline with new scan")
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
 
-    ports = parse_ports(args.ports)
     try:
-        target_ip = socket.gethostbyname(args.target)
-    except socket.gaierror:
+        port_ranges = parse_ports(args.ports)
+    except ValueError as e:
+        print(Fore.RED + f"[-] Invalid port list {args.ports!r}: {e}")
+        return
+    port_count = sum(end - start + 1 for start, end in port_ranges)
+    try:
+        target_ip = resolve(args.target)
+    except (OSError, UnicodeError):  # gaierror, or an IDNA-invalid name
         print(Fore.RED + f"[-] Could not resolve target: {args.target}")
         return
 
-    print(Fore.CYAN + f"[+] Scanning {args.target} on {len(ports)} ports...")
-    open_ports = []
-    
-    with ThreadPoolExecutor(max_workers=args.threads) as executor:
-        futures = {executor.submit(scan_port, target_ip, port): port for port in ports}
-        for future in tqdm(as_completed(futures), total=len(futures), desc="Scanning", ncols=80):
-            result = future.result()
-            if result:
-                open_ports.append(result)
-
-    open_ports = sorted(open_ports)
-    print(Fore.GREEN + f"[+] Found {len(open_ports)} open ports.")
-
-    # Load baseline
-    if os.path.exists(args.baseline):
-        with open(args.baseline, "r") as f:
-            baseline_data = json.load(f)
-    else:
-        baseline_data = {}
+    print(Fore.CYAN + f"[+] Scanning {args.target} on {port_count} ports...")
+    current_set = set()
+
+    # Advance the bar in blocks; a localhost scan finishes ports far faster
+    # than tqdm needs to redraw
+    with tqdm(total=port_count, desc="Scanning", ncols=80, mininterval=0.5) as bar:
+        finished = 0
+        for port, is_open in scan_ports(target_ip, iter_ports(port_ranges), max_inflight=fd_limited(args.threads, uses_select=True)):
+            if is_open:
+                current_set.add(port)
+            finished += 1
+            if finished == PROGRESS_STEP:
+                bar.update(finished)
+                finished = 0
+        bar.update(finished)
 
-    previous_ports = baseline_data.get(args.target, [])
-    current_set = set(open_ports)
-    previous_set = set(previous_ports)
+    print(Fore.GREEN + f"[+] Found {len(current_set)} open ports.")
+
+    # Load this target's baseline only
+    target_path = baseline_path(open_baseline_dir(args.baseline), args.target)
+    baseline_exists = os.path.exists(target_path)
+    if baseline_exists:
+        with open(target_path, "r") as f:
+            previous_set = set(json.load(f))
+    else:
+        previous_set = set()
 
-    new_ports = sorted(list(current_set - previous_set))
-    closed_ports = sorted(list(previous_set - current_set))
+    new_ports = sorted(current_set - previous_set)
+    closed_ports = sorted(previous_set - current_set)
 
     print(Fore.YELLOW + f"[+] New open ports: {new_ports if new_ports else 'None'}")
     print(Fore.MAGENTA + f"[+] Closed ports: {closed_ports if closed_ports else 'None'}")
@@ -132,26 +248,20 @@ def main():
             with open(args.output, "w", newline="") as f:
                 writer = csv.writer(f)
                 writer.writerow(["Change Type", "Port"])
-                for p in new_ports:
-                    writer.writerow(["NEW", p])
-                for p in closed_ports:
-                    writer.writerow(["CLOSED", p])
+                writer.writerows(("NEW", p) for p in new_ports)
+                writer.writerows(("CLOSED", p) for p in closed_ports)
             print(Fore.YELLOW + f"[+] Diff saved to: {os.path.abspath(args.output)}")
         except Exception as e:
             print(Fore.RED + f"[-] Failed to save output: {e}")
 
     # Update baseline if requested
     if args.save_new:
-        baseline_data[args.target] = open_ports
-        with open(args.baseline, "w") as f:
-            json.dump(baseline_data, f, indent=4)
-        print(Fore.CYAN + f"[+] Baseline updated: {args.baseline}")
-    elif not os.path.exists(args.baseline):
+        save_baseline(target_path, sorted(current_set))
+        print(Fore.CYAN + f"[+] Baseline updated: {target_path}")
+    elif not baseline_exists:
         print(Fore.YELLOW + f"[!] No baseline found. Creating new baseline file.")
-        baseline_data[args.target] = open_ports
-        with open(args.baseline, "w") as f:
-            json.dump(baseline_data, f, indent=4)
-        print(Fore.CYAN + f"[+] Baseline saved: {args.baseline}")
+        save_baseline(target_path, sorted(current_set))
+        print(Fore.CYAN + f"[+] Baseline saved: {target_path}")
 
 if __name__ == "__main__":
     main()
@@ -5,8 +5,9 @@ ServWatch - Service Uptime & Port Monitor (Cross-Platform)
 Monitors a list of services (IP:Port or Host:Port) for uptime over time.
 
 Features:
-- Tracks service availability
+- Tracks service availability (checks run concurrently)
 - Logs latency in milliseconds
+- Resolves hostnames once at startup (refreshed hourly), not every check
 - Saves results to CSV
 - Color-coded terminal output
 - Auto-creates input file if missing
@@ -14,16 +15,19 @@ Features:
 
 USAGE EXAMPLES:
     python3 servwatch.py -f services.txt -i 30 -o service_log.csv
+    python3 servwatch.py -f services.txt -o service_log.jsonl --format jsonl
 
 Arguments:
     -f, --file       File with IP:port targets (one per line)
     -i, --interval   Check interval in seconds (default: 30)
-    -o, --output     Output CSV file (default: service_log.csv)
+    -o, --output     Output log file (default: service_log.csv)
+    --format         Log format: csv or jsonl (default: csv)
 
 Each line in the file must be in the format: IP:PORT or HOSTNAME:PORT
 
 Dependencies:
     pip install colorama
+    pip install orjson  # Optional, faster --format jsonl
 
 Tested on Windows, Linux, macOS.
 """
@@ -31,27 +35,60 @@ Tested on Windows, Linux, macOS.
 import socket
 import os
 import csv
+import json
 import time
 import argparse
 import subprocess
 import platform
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 from colorama import Fore, init
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 init(autoreset=True)
 
+LOG_FIELDS = ["Timestamp", "Host", "Port", "Status", "Latency (ms)"]
+JSON_KEYS = ("ts", "host", "port", "status", "ms")
+RESOLVE_TTL = 3600  # Seconds before hostnames are looked up again
+
 # -------------------------------
 # Check if IP:Port is reachable
 # -------------------------------
-def check_service(ip, port, timeout=2):
+def check_service(addr, timeout=2):
+    # addr comes pre-resolved from resolve_services(), so no DNS lookup here
+    if addr is None:
+        return "DOWN", "Unresolved"
+    family, sockaddr = addr
+    sock = socket.socket(family, socket.SOCK_STREAM)
+    sock.settimeout(timeout)
     try:
-        start = time.time()
-        sock = socket.create_connection((ip, port), timeout)
-        latency = round((time.time() - start) * 1000, 2)
-        sock.close()
+        # perf_counter is monotonic, so NTP steps can't skew the latency
+        start = time.perf_counter()
+        sock.connect(sockaddr)
+        latency = round((time.perf_counter() - start) * 1000, 2)
         return "UP", latency
-    except:
+    except OSError:
         return "DOWN", "Timeout"
+    finally:
+        sock.close()
+
+# -------------------------------
+# Resolve hosts once (refreshed every RESOLVE_TTL seconds)
+# -------------------------------
+def resolve_services(services):
+    addrs = []
+    for host, port in services:
+        try:
+            family, _, _, _, sockaddr = socket.getaddrinfo(host, port, type=socket.SOCK_STREAM)[0]
+            addrs.append((family, sockaddr))
+        except (OSError, UnicodeError):  # gaierror, or an IDNA-invalid name
+            print(Fore.YELLOW + f"[!] Could not resolve {host}; reporting it as DOWN until it does.")
+            addrs.append(None)
+    return addrs
 
 # -------------------------------
 # Load services from file
@@ -77,26 +114,38 @@ def load_services(filename):
         return services
 
 # -------------------------------
-# Write result to CSV
+# Open the output log, returning (file, batch writer)
 # -------------------------------
-def log_result(file, row):
-    file_exists = os.path.isfile(file)
-    with open(file, "a", newline="") as f:
-        writer = csv.writer(f)
-        if not file_exists:
-            writer.writerow(["Timestamp", "Host", "Port", "Status", "Latency (ms)"])
-        writer.writerow(row)
+def open_log(path, fmt):
+    if fmt == "jsonl":
+        out_file = open(path, "ab", buffering=1 << 16)
+        return out_file, lambda rows: out_file.writelines(map(json_line, rows))
+
+    out_file = open(path, "a", newline="", buffering=1 << 16)
+    writer = csv.writer(out_file)
+    # Decided once per run: append mode opens at EOF, so position 0 means
+    # an empty/new file that still needs its header
+    if out_file.tell() == 0:
+        writer.writerow(LOG_FIELDS)
+    return out_file, writer.writerows
+
+def json_line(row):
+    record = dict(zip(JSON_KEYS, row))
+    if orjson is not None:
+        return orjson.dumps(record) + b"\n"
+    return (json.dumps(record, separators=(",", ":")) + "\n").encode()
 
 # -------------------------------
 # Main loop
 # -------------------------------
-def main():
+def main(argv=None):
     parser = argparse.ArgumentParser(description="Service Uptime Monitor (Cross-Platform)")
     parser.add_argument("-f", "--file", help="Target service file", required=True)
     parser.add_argument("-i", "--interval", type=int, default=30, help="Check interval (seconds)")
-    parser.add_argument("-o", "--output", default="service_log.csv", help="CSV output file")
+    parser.add_argument("-o", "--output", default="service_log.csv", help="Output log file")
+    parser.add_argument("--format", choices=["csv", "jsonl"], default="csv", help="Log format (default: csv)")
 
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
     services = load_services(args.file)
 
     if not services:
@@ -105,17 +154,45 @@ def main():
     print(Fore.CYAN + f"[+] Monitoring {len(services)} services every {args.interval}s. Output: {args.output}")
 
     try:
-        while True:
-            print(Fore.BLUE + f"\n[{datetime.now().strftime('%H:%M:%S')}] Checking services...")
-            for host, port in services:
-                status, latency = check_service(host, port)
-                log_result(args.output, [datetime.now().isoformat(), host, port, status, latency])
-
-                if status == "UP":
-                    print(Fore.GREEN + f"[+] {host}:{port} is UP - {latency} ms")
-                else:
-                    print(Fore.RED + f"[-] {host}:{port} is DOWN - {latency}")
-            time.sleep(args.interval)
+        out_file, log_results = open_log(args.output, args.format)
+        # One pool for the whole run, so threads aren't rebuilt every interval
+        executor = ThreadPoolExecutor(max_workers=min(len(services), 200))
+        with out_file:
+            try:
+                # Bound once here to skip the global/attribute lookups per service
+                green, red = Fore.GREEN, Fore.RED
+                addrs, resolved_at = resolve_services(services), time.monotonic()
+                while True:
+                    started = time.monotonic()
+                    if started - resolved_at > RESOLVE_TTL:
+                        addrs, resolved_at = resolve_services(services), started
+                    # One wall-clock read per interval; every row in it shares the stamp
+                    tick = datetime.now()
+                    ts = tick.isoformat()
+                    print(Fore.BLUE + f"\n[{tick.strftime('%H:%M:%S')}] Checking services...")
+                    rows = []
+                    add_row = rows.append
+                    futures = {executor.submit(check_service, addr): service for service, addr in zip(services, addrs)}
+                    try:
+                        for future in as_completed(futures):
+                            host, port = futures[future]
+                            status, latency = future.result()
+                            add_row([ts, host, port, status, latency])
+                            # One template for both outcomes; only the colour/mark/unit differ
+                            color, mark, unit = (green, "+", " ms") if status == "UP" else (red, "-", "")
+                            print(f"{color}[{mark}] {host}:{port} is {status} - {latency}{unit}")
+                    finally:
+                        # One write + flush per interval; on Ctrl+C this still
+                        # saves the checks that finished before the file closes.
+                        log_results(rows)
+                        out_file.flush()
+                    # Sleep only for what's left of the interval so slow checks don't drift
+                    time.sleep(max(0, args.interval - (time.monotonic() - started)))
+            except KeyboardInterrupt:
+                # Drop queued checks instead of letting each one run out its
+                # timeout before the monitor can exit
+                executor.shutdown(wait=False, cancel_futures=True)
+                raise
 
     except KeyboardInterrupt:
         print(Fore.YELLOW + "\n[!] Monitor stopped by user.")
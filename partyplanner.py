@@ -1,7 +1,10 @@
 #Chris Giggleman CPT-168 Python Programming
 #Party Planner Final Exam Project
 #July 2, 2023
+import bisect
 import csv
+import sys
+from collections import Counter
 
 # List of attendee types and fees which are pre-set for the event.
 attendee_types = {
@@ -14,202 +17,200 @@ attendee_types = {
     'Other': 25.00
 }
 
-# Function to read the CSV file and return a list of attendees
-def read_csv():
+# Menu option lists, built once and shared by the add/update prompts.
+ATTENDEE_TYPE_LIST = list(attendee_types)
+MENU_CHOICES = ["Chicken", "Fish", "Vegetarian", "Pork", "Other"]
+DRINK_CHOICES = ["Water", "Soda", "Coffee", "Tea", "Wine", "Beer", "Other"]
+
+# Numbered option menus, formatted once instead of on every prompt
+TYPE_MENU_STR = "\n".join(f"{i}. {v}" for i, v in enumerate(ATTENDEE_TYPE_LIST, 1))
+FOOD_MENU_STR = "\n".join(f"{i}. {v}" for i, v in enumerate(MENU_CHOICES, 1))
+DRINK_MENU_STR = "\n".join(f"{i}. {v}" for i, v in enumerate(DRINK_CHOICES, 1))
+
+# Characters that make csv.writer quote a field
+NEEDS_QUOTING = frozenset(',"\r\n')
+
+# Function to map each name to its row positions (names may repeat).
+# menu() also keeps folded_names, a casefolded copy of each name in row
+# order, so searching doesn't re-lowercase every name each time.
+def build_name_index(attendees):
+    name_index = {}
+    for i, attendee in enumerate(attendees):
+        name_index.setdefault(attendee[0], []).append(i)
+    return name_index
+
+# Function to show a numbered menu and return the chosen option (None if invalid)
+def pick_option(header, menu_str, options, prompt, error):
+    print(header)
+    print(menu_str)
+    choice = input(prompt)
+    try:
+        choice = int(choice)
+        if 1 <= choice <= len(options):
+            return options[choice - 1]
+    except ValueError:
+        pass
+    print(error)
+    return None
+
+# Function to stream attendees from the CSV file one row at a time
+def iter_attendees():
     try:
-        with open('Partyplanner.csv', 'r') as file:
+        # newline='' lets the csv module handle line endings; big buffer = fewer reads
+        with open('Partyplanner.csv', 'r', newline='', buffering=1 << 20) as file:
             reader = csv.reader(file)
-            attendees = list(reader)
-        return attendees
+            for row in reader:
+                if not row:
+                    continue
+                # Parse the fee once on load so reports and sorting work on floats
+                try:
+                    yield row[:4] + [float(row[4].replace("$", ""))]
+                except (IndexError, ValueError):
+                    print(f"Skipping malformed row on line {reader.line_num}: {','.join(row)}")
+                    print("(It will not be kept when the attendee list is saved.)")
     except FileNotFoundError:
-        return []
+        return
+
+# Function to read the CSV file and return a list of attendees
+def read_csv():
+    return list(iter_attendees())
 
 # Function to write the list of attendees to the CSV file
 def write_csv(attendees):
-    with open('Partyplanner.csv', 'w', newline='') as file:
-        writer = csv.writer(file)
-        writer.writerows(attendees)
+    with open('Partyplanner.csv', 'w', newline='', buffering=1 << 16) as file:
+        # Only a typed-in name can need quoting (types/menu/drinks come from
+        # the fixed lists), so join rows directly unless some field would
+        if any(NEEDS_QUOTING.intersection(field) for attendee in attendees for field in attendee[:4]):
+            writer = csv.writer(file)
+            writer.writerows(attendee[:4] + [format(attendee[4], ".2f")] for attendee in attendees)
+        else:
+            # Same "\r\n" row ending csv.writer uses
+            file.writelines(f"{n},{t},{m},{d},{fee:.2f}\r\n" for n, t, m, d, fee in attendees)
 
 # Function to add a new attendee to the list
-def add_attendee(attendees):
+def add_attendee(attendees, name_index, folded_names):
     print("Enter New Attendee Information:")
     name = input("Enter the attendee's name: ")
 
-    # Displaying attendee types and getting user input for attendee type
-    print("Attendee Types:")
-    for i, attendee_type in enumerate(attendee_types.keys(), 1):
-        print(f"{i}. {attendee_type}")
-    attendee_type_choice = input("Enter the number for the attendee type: ")
-
-    try:
-        attendee_type_choice = int(attendee_type_choice)
-        if 1 <= attendee_type_choice <= len(attendee_types):
-            attendee_type = list(attendee_types.keys())[attendee_type_choice - 1]
-        else:
-            print("Invalid attendee type choice.")
-            return
-    except ValueError:
-        print("Invalid input, please choose from the list.")
+    attendee_type = pick_option("Attendee Types:", TYPE_MENU_STR, ATTENDEE_TYPE_LIST,
+                                "Enter the number for the attendee type: ", "Invalid attendee type choice.")
+    if attendee_type is None:
         return
-
-    # Displaying menu choices and getting user input for menu choice
-    menu_choices = ["Chicken", "Fish", "Vegetarian", "Pork", "Other"]
-    print("Menu Choices:")
-    for i, menu_choice in enumerate(menu_choices, 1):
-        print(f"{i}. {menu_choice}")
-    menu_choice = input("Enter the number for the menu choice: ")
-
-    try:
-        menu_choice = int(menu_choice)
-        if 1 <= menu_choice <= len(menu_choices):
-            menu_choice = menu_choices[menu_choice - 1]
-        else:
-            print("Invalid menu choice.")
-            return
-    except ValueError:
-        print("Invalid input for menu choice.")
+    menu_choice = pick_option("Menu Choices:", FOOD_MENU_STR, MENU_CHOICES,
+                              "Enter the number for the menu choice: ", "Invalid menu choice.")
+    if menu_choice is None:
         return
-
-    # Displaying drink choices and getting user input for drink choice
-    drink_choices = ["Water", "Soda", "Coffee", "Tea", "Wine", "Beer", "Other"]
-    print("Drink Choices:")
-    for i, drink_choice in enumerate(drink_choices, 1):
-        print(f"{i}. {drink_choice}")
-    drink_choice = input("Enter the number for the drink choice: ")
-
-    try:
-        drink_choice = int(drink_choice)
-        if 1 <= drink_choice <= len(drink_choices):
-            drink_choice = drink_choices[drink_choice - 1]
-        else:
-            print("Invalid drink choice.")
-            return
-    except ValueError:
-        print("Invalid input for drink choice.")
+    drink_choice = pick_option("Drink Choices:", DRINK_MENU_STR, DRINK_CHOICES,
+                               "Enter the number for the drink choice: ", "Invalid drink choice.")
+    if drink_choice is None:
         return
 
     fee_paid = attendee_types[attendee_type]  # Calculating the fee based on the attendee type
 
-    attendees.append([name, attendee_type, menu_choice, drink_choice, format(fee_paid, ".2f")])
+    attendees.append([name, attendee_type, menu_choice, drink_choice, fee_paid])
+    name_index.setdefault(name, []).append(len(attendees) - 1)
+    folded_names.append(name.casefold())
 
     print("Attendee added successfully!")
 
 # Function to generate reports based on the list of attendees
 def generate_reports(attendees):
-    print("-------Attendees List-------")
-    print("Name\t\tAttendee Type\tMenu Choice\tDrink Choice\tFee Paid")
-    print("------------------------------------------------------------")
-    for attendee in attendees:
-        name = attendee[0].ljust(15)
-        attendee_type = attendee[1].ljust(14)
-        menu_choice = attendee[2].ljust(20)
-        drink_choice = attendee[3].ljust(15)
-        fee_paid = attendee[4]
-        print(f"{name}{attendee_type}{menu_choice}{drink_choice}${fee_paid.replace('.00', '')}")
-
-    total_fees = sum(float(attendee[4].replace("$", "")) for attendee in attendees)
-    print("\nTotal Fees: ${:.2f}".format(total_fees))
-    print("Total Attendees:", len(attendees))
-
-    attendee_type_counts = {type: 0 for type in attendee_types}
-    for attendee in attendees:
-        attendee_type_counts[attendee[1]] += 1
-
-    print("\nAttendee Type Counts:")
-    for type, count in attendee_type_counts.items():
-        print(f"{type}: {count}")
-
-    menu_choices = [attendee[2] for attendee in attendees]
-    menu_choice_counts = {choice: menu_choices.count(choice) for choice in set(menu_choices)}
-    print("\nMenu Choice Counts:")
-    for choice, count in menu_choice_counts.items():
-        print(f"{choice}: {count}")
-
-    drink_choices = [attendee[3] for attendee in attendees]
-    drink_choice_counts = {choice: drink_choices.count(choice) for choice in set(drink_choices)}
-    print("\nDrink Choice Counts:")
-    for choice, count in drink_choice_counts.items():
-        print(f"{choice}: {count}")
+    # Build the whole report first and write it out once, rather than
+    # taking a print() per line
+    report = [
+        "-------Attendees List-------\n",
+        "Name\t\tAttendee Type\tMenu Choice\tDrink Choice\tFee Paid\n",
+        "------------------------------------------------------------\n",
+    ]
+    add = report.append
+    for name, attendee_type, menu_choice, drink_choice, fee_paid in attendees:
+        fee_paid = format(fee_paid, ".2f").replace('.00', '')
+        add(f"{name:<15}{attendee_type:<14}{menu_choice:<20}{drink_choice:<15}${fee_paid}\n")
+
+    total_fees = sum(attendee[4] for attendee in attendees)
+    add(f"\nTotal Fees: ${total_fees:.2f}\n")
+    add(f"Total Attendees: {len(attendees)}\n")
+
+    # One Counter pass per column instead of list.count() per distinct value
+    # Seeded with every known type so zero counts still print, in table order
+    attendee_type_counts = Counter(dict.fromkeys(attendee_types, 0))
+    attendee_type_counts.update(attendee[1] for attendee in attendees)
+    add("\nAttendee Type Counts:\n")
+    report.extend(f"{type}: {count}\n" for type, count in attendee_type_counts.items())
+
+    menu_choice_counts = Counter(attendee[2] for attendee in attendees)
+    add("\nMenu Choice Counts:\n")
+    report.extend(f"{choice}: {count}\n" for choice, count in menu_choice_counts.items())
+
+    drink_choice_counts = Counter(attendee[3] for attendee in attendees)
+    add("\nDrink Choice Counts:\n")
+    report.extend(f"{choice}: {count}\n" for choice, count in drink_choice_counts.items())
+
+    sys.stdout.write("".join(report))
+    sys.stdout.flush()
 
 # Function to update an existing attendee in the list
-def update_attendee(attendees):
+def update_attendee(attendees, name_index):
     name = input("Enter the name of the attendee to update: ")
-    for attendee in attendees:
-        if attendee[0] == name:
-            print(f"Attendee found: {attendee[0]}")
-            
-            # Displaying attendee types and getting user input for the new attendee type
-            print("Attendee Types:")
-            for i, attendee_type in enumerate(attendee_types.keys(), 1):
-                print(f"{i}. {attendee_type}")
-            attendee_type_choice = input("Enter the number for the new attendee type: ")
-
-            try:
-                attendee_type_choice = int(attendee_type_choice)
-                if 1 <= attendee_type_choice <= len(attendee_types):
-                    attendee_type = list(attendee_types.keys())[attendee_type_choice - 1]
-                    fee_paid = attendee_types[attendee_type]
-
-                    menu_choices = ["Chicken", "Fish", "Vegetarian", "Pork", "Other"]
-                    print("Menu Choices:")
-                    for i, menu_choice in enumerate(menu_choices, 1):
-                        print(f"{i}. {menu_choice}")
-                    menu_choice_index = input("Enter the number for the new menu choice: ")
-
-                    drink_choices = ["Water", "Soda", "Coffee", "Tea", "Wine", "Beer", "Other"]
-                    print("Drink Choices:")
-                    for i, drink_choice in enumerate(drink_choices, 1):
-                        print(f"{i}. {drink_choice}")
-                    drink_choice_index = input("Enter the number for the new drink choice: ")
-
-                    try:
-                        menu_choice_index = int(menu_choice_index)
-                        drink_choice_index = int(drink_choice_index)
-
-                        if 1 <= menu_choice_index <= len(menu_choices) and 1 <= drink_choice_index <= len(drink_choices):
-                            menu_choice = menu_choices[menu_choice_index - 1]
-                            drink_choice = drink_choices[drink_choice_index - 1]
-
-                            # Updating the attendee details
-                            attendee[1] = attendee_type
-                            attendee[2] = menu_choice
-                            attendee[3] = drink_choice
-                            attendee[4] = format(fee_paid, ".2f")
-
-                            print("Attendee updated successfully!")
-                        else:
-                            print("Invalid menu choice or drink choice.")
-                    except ValueError:
-                        print("Invalid input for menu choice or drink choice.")
-                else:
-                    print("Invalid attendee type choice.")
-            except ValueError:
-                print("Invalid input for attendee type choice.")
-
-            return
-
-    print("Attendee not found.")
+    positions = name_index.get(name)
+    if not positions:
+        print("Attendee not found.")
+        return
+
+    attendee = attendees[positions[0]]
+    print(f"Attendee found: {attendee[0]}")
+
+    attendee_type = pick_option("Attendee Types:", TYPE_MENU_STR, ATTENDEE_TYPE_LIST,
+                                "Enter the number for the new attendee type: ", "Invalid attendee type choice.")
+    if attendee_type is None:
+        return
+    menu_choice = pick_option("Menu Choices:", FOOD_MENU_STR, MENU_CHOICES,
+                              "Enter the number for the new menu choice: ", "Invalid menu choice.")
+    if menu_choice is None:
+        return
+    drink_choice = pick_option("Drink Choices:", DRINK_MENU_STR, DRINK_CHOICES,
+                               "Enter the number for the new drink choice: ", "Invalid drink choice.")
+    if drink_choice is None:
+        return
+
+    # Updating the attendee details
+    attendee[1] = attendee_type
+    attendee[2] = menu_choice
+    attendee[3] = drink_choice
+    attendee[4] = attendee_types[attendee_type]
+
+    print("Attendee updated successfully!")
 
 
 # Function to delete an attendee from the list
-def delete_attendee(attendees):
+def delete_attendee(attendees, name_index, folded_names):
     name = input("Enter the name of the attendee to delete: ")
-    for attendee in attendees:
-        if attendee[0] == name:
-            attendees.remove(attendee)
-            print("Attendee deleted successfully!")
-            return
+    positions = name_index.get(name)
+    if not positions:
+        print("Attendee not found.")
+        return
 
-    print("Attendee not found.")
+    position = positions.pop(0)
+    if not positions:
+        del name_index[name]
+
+    # Swap-remove: move the last row into the gap instead of shifting the list
+    last = attendees.pop()
+    last_folded = folded_names.pop()
+    if position < len(attendees):
+        attendees[position] = last
+        folded_names[position] = last_folded
+        # Keep each position list sorted so [0] is always the first match
+        moved = name_index[last[0]]
+        moved.remove(len(attendees))
+        bisect.insort(moved, position)
+    print("Attendee deleted successfully!")
 
 # Function to search for an attendee in the list
-def search_attendee(attendees):
+def search_attendee(attendees, folded_names):
     search_name = input("Enter the name or a part of the name of the attendee to search: ")
-    search_results = []
-
-    for attendee in attendees:
-        if search_name.lower() in attendee[0].lower():
-            search_results.append(attendee)
+    query = search_name.casefold()
+    search_results = [attendees[i] for i, folded in enumerate(folded_names) if query in folded]
 
     if len(search_results) > 0:
         print("Attendee(s) found:")
@@ -218,7 +219,7 @@ def search_attendee(attendees):
             print(f"Attendee Type: {result[1]}")
             print(f"Menu Choice: {result[2]}")
             print(f"Drink Choice: {result[3]}")
-            print(f"Fee Paid: ${result[4]}")
+            print(f"Fee Paid: ${result[4]:.2f}")
             print("---------------------")
     else:
         print("Attendee not found.")
@@ -239,7 +240,7 @@ def sort_attendee_list(attendees):
         attendees.sort(key=lambda x: x[3])
         print("Attendee list sorted by Drink Choice.")
     elif sort_by.lower() == "fee":
-        attendees.sort(key=lambda x: float(x[4].replace("$", "")))
+        attendees.sort(key=lambda x: x[4])
         print("Attendee list sorted by Fee Paid.")
     else:
         print("Invalid field to sort by.")
@@ -247,6 +248,8 @@ def sort_attendee_list(attendees):
 # Main menu function to manage the party planner application
 def menu():
     attendees = read_csv()
+    name_index = build_name_index(attendees)
+    folded_names = [attendee[0].casefold() for attendee in attendees]
 
     while True:
         print("\n----- Party Planner Menu -----")
@@ -261,17 +264,19 @@ def menu():
         choice = input("\nEnter your choice: ")
 
         if choice == "1":
-            add_attendee(attendees)
+            add_attendee(attendees, name_index, folded_names)
         elif choice == "2":
             generate_reports(attendees)
         elif choice == "3":
-            update_attendee(attendees)
+            update_attendee(attendees, name_index)
         elif choice == "4":
-            delete_attendee(attendees)
+            delete_attendee(attendees, name_index, folded_names)
         elif choice == "5":
-            search_attendee(attendees)
+            search_attendee(attendees, folded_names)
         elif choice == "6":
             sort_attendee_list(attendees)
+            name_index = build_name_index(attendees)  # Positions changed
+            folded_names = [attendee[0].casefold() for attendee in attendees]
         elif choice == "0":
             write_csv(attendees)
             print("Exiting Party Planner...")